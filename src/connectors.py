@@ -1,6 +1,14 @@
 import time
+import asyncio
 import logging
+import threading
+import aiohttp
 import requests
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from aiolimiter import AsyncLimiter
 from typing import Optional, Dict, Any
 from .config import Config
 
@@ -9,31 +17,114 @@ from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# Rate limiting: bursts of up to 5 requests, then one request every 0.6 seconds on average.
+RATE_LIMIT_BURST = 5
+RATE_LIMIT_INTERVAL = 0.6
+
+# Retry policy shared by the sync (urllib3 adapter) and async clients.
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 1
+RETRY_STATUS_FORCELIST = [429, 500, 502, 503, 504]
+
+
+class RawgRequestError(Exception):
+    """
+    Raised by AsyncRawgApiClient when a request could not be completed.
+
+    Attributes:
+        status (Optional[int]): HTTP status of the last response (None for connection errors and timeouts).
+        retried (bool): True if the failure was retryable (429/5xx, connection error, timeout) and
+            persisted after every retry; False if the API answered with a non-retryable status.
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None, retried: bool = False):
+        super().__init__(message)
+        self.status = status
+        self.retried = retried
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket used to pace synchronous requests.
+
+    Tokens refill at one per `interval` seconds up to `capacity`, so requests after an
+    idle period go out immediately and only sustained usage is slowed down.
+    """
+
+    def __init__(self, capacity: int, interval: float):
+        self.capacity = capacity
+        self.interval = interval
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes one token, sleeping until one is available if the bucket is empty."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) / self.interval)
+            self._last_refill = now
+
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) * self.interval)
+                self._tokens = 0.0
+                self._last_refill = time.monotonic()
+            else:
+                self._tokens -= 1
+
+
+def _build_session() -> requests.Session:
+    """
+    Builds the HTTP session shared by every RawgApiClient instance.
+
+    A single session keeps the connection pool (and therefore the TCP/TLS
+    connection to api.rawg.io) alive across clients, so only the first request
+    pays the handshake. Transient errors and 429s are retried by urllib3.
+    """
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": "RawgDataPipeline/1.0 (Educational Project)"
+    })
+
+    retry_strategy = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        allowed_methods=["GET"]
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry_strategy)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+
 class RawgApiClient:
     """
     A robust client for interacting with the RAWG Video Games API.
     
     Attributes:
-        session (requests.Session): The persistent HTTP session.
+        session (requests.Session): The persistent HTTP session (shared module-wide).
         base_url (str): The base URL for the API.
         api_key (str): The API key for authentication.
     """
 
     def __init__(self):
-        """Initializes the RawgApiClient with a session and default headers."""
+        """Initializes the RawgApiClient bound to the shared session."""
         self.base_url = Config.BASE_URL
         self.api_key = Config.RAWG_API_KEY
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "RawgDataPipeline/1.0 (Educational Project)"
-        })
+        self.session = _SESSION
+        self._limiter = _TokenBucket(RATE_LIMIT_BURST, RATE_LIMIT_INTERVAL)
         
         if not self.api_key:
             logger.warning("RAWG_API_KEY is missing. API calls will likely fail.")
 
-    def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    def get_resource(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """
-        Internal method to perform GET requests with rate limiting and error handling.
+        Performs a GET request with rate limiting and error handling.
+        Single entry point for every RAWG endpoint; retries are handled by the session adapter.
 
         Args:
             endpoint (str): The API endpoint to query (e.g., 'games').
@@ -50,9 +141,9 @@ class RawgApiClient:
         # Inject API Key automatically
         params["key"] = self.api_key
         
-        # Rate Limiting: Sleep 0.6 seconds before request
+        # Rate Limiting: token bucket (bursts allowed, ~1 request / 0.6 s sustained)
         # RAWG allows limited requests, so this helps avoid immediate 429s.
-        time.sleep(0.6)
+        self._limiter.acquire()
 
         try:
             response = self.session.get(url, params=params, timeout=10)
@@ -69,3 +160,124 @@ class RawgApiClient:
             logger.error(f"Unexpected Request Error querying {url}: {e}")
             
         return None
+
+
+class AsyncRawgApiClient:
+    """
+    Asynchronous counterpart of RawgApiClient, used to fetch many pages concurrently.
+
+    Must be used as an async context manager so the aiohttp session is closed:
+
+        async with AsyncRawgApiClient() as client:
+            data = await client.get_resource("games", params={"page": 1})
+
+    Attributes:
+        session (aiohttp.ClientSession): The HTTP session (open only inside the context).
+        base_url (str): The base URL for the API.
+        api_key (str): The API key for authentication.
+    """
+
+    def __init__(self, max_concurrency: int = 4):
+        """
+        Initializes the client. The session itself is created in __aenter__.
+
+        Args:
+            max_concurrency (int): Maximum number of requests in flight at once.
+        """
+        self.base_url = Config.BASE_URL
+        self.api_key = Config.RAWG_API_KEY
+        self.max_concurrency = max_concurrency
+        self.session: Optional[aiohttp.ClientSession] = None
+
+        # Concurrency cap + token bucket shared by every request of this client,
+        # with the same burst / sustained rate as the synchronous client.
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._limiter = AsyncLimiter(RATE_LIMIT_BURST, RATE_LIMIT_BURST * RATE_LIMIT_INTERVAL)
+
+        if not self.api_key:
+            logger.warning("RAWG_API_KEY is missing. API calls will likely fail.")
+
+    async def __aenter__(self) -> "AsyncRawgApiClient":
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+            headers={"User-Agent": "RawgDataPipeline/1.0 (Educational Project)"},
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+        self.session = None
+
+    async def get_resource(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Performs a GET request with rate limiting and error handling (async version).
+        Retries 429/5xx responses, connection errors and timeouts with the same policy
+        as the sync session adapter, honoring Retry-After when the API sends it.
+
+        Args:
+            endpoint (str): The API endpoint to query (e.g., 'games').
+            params (dict, optional): Query parameters.
+
+        Returns:
+            Dict[str, Any]: The JSON response dictionary.
+
+        Raises:
+            RawgRequestError: On a non-retryable status (e.g. 404 "Invalid page."), or once
+                a retryable failure persisted after every retry.
+        """
+        url = f"{self.base_url}/{endpoint}"
+
+        params = dict(params) if params else {}
+
+        # Inject API Key automatically (aiohttp rejects None values)
+        if self.api_key:
+            params["key"] = self.api_key
+
+        for attempt in range(RETRY_TOTAL + 1):
+            retry_after = status = None
+            async with self._semaphore:
+                async with self._limiter:
+                    # Logged here, once the request actually goes out (not when it gets queued)
+                    page_info = f" (page {params['page']})" if "page" in params else ""
+                    logger.info(f"Requesting {endpoint}{page_info}...")
+                    try:
+                        async with self.session.get(url, params=params) as response:
+                            if response.status < 400:
+                                return await response.json()
+
+                            status = response.status
+                            error = f"HTTP Error querying {url}: {status} - {await response.text()}"
+                            if status not in RETRY_STATUS_FORCELIST:
+                                raise RawgRequestError(error, status=status)
+                            retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+
+                    except aiohttp.ClientConnectionError as e:
+                        error = f"Connection Error querying {url}: {e}"
+                    except asyncio.TimeoutError as e:
+                        error = f"Timeout Error querying {url}: {e}"
+                    except aiohttp.ClientError as e:
+                        error = f"Unexpected Request Error querying {url}: {e}"
+
+            if attempt == RETRY_TOTAL:
+                raise RawgRequestError(f"{error} (giving up after {RETRY_TOTAL} retries)", status=status, retried=True)
+
+            # Same backoff as urllib3 (factor * 2^n), unless the server sent Retry-After.
+            # The sleep happens outside the semaphore so other pages keep going.
+            delay = retry_after if retry_after is not None else RETRY_BACKOFF_FACTOR * 2 ** attempt
+            logger.warning(f"{error}. Retrying in {delay:.1f}s ({attempt + 1}/{RETRY_TOTAL})...")
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parses a Retry-After header given in seconds or as an HTTP date."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
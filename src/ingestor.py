@@ -1,16 +1,223 @@
 import os
 import json
+import math
+import asyncio
 import logging
+import threading
 import pandas as pd
+import pyarrow as pa
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from deltalake import write_deltalake, DeltaTable
-from typing import List, Dict, Any, Optional
+from deltalake import write_deltalake, DeltaTable, WriterProperties
+from deltalake.exceptions import TableNotFoundError
+from typing import List, Dict, Any, Optional, Callable
 
-from .connectors import RawgApiClient
+from .connectors import RawgApiClient, AsyncRawgApiClient, RawgRequestError
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# Parquet de Bronze comprimido con ZSTD: las columnas JSON serializadas comprimen mucho mejor que con snappy.
+BRONZE_WRITER_PROPERTIES = WriterProperties(compression="ZSTD", compression_level=3, max_row_group_size=50_000)
+
+# Propiedades de la tabla games al crearla: archivos objetivo de 16 MB por partición,
+# para que el delete idempotente de una extraction_date reescriba poco.
+GAMES_TABLE_CONFIGURATION = {"delta.targetFileSize": "16777216"}
+
+# Filas acumuladas antes de escribir una tanda en Bronze games: acota la memoria en backfills
+# grandes sin generar un archivo (y un commit) por cada página de 20 juegos.
+GAMES_WRITE_CHUNK_ROWS = 10_000
+
+# Esquema fijo de la tabla Bronze games (campos de /games en RAWG + auditoría).
+# Evita la inferencia de tipos en cada escritura y la deriva de tipos entre corridas
+# (ej. una columna que un día llega toda nula). Las columnas anidadas van como JSON string.
+GAMES_ARROW_SCHEMA = pa.schema([
+    pa.field("id", pa.int64()),
+    pa.field("slug", pa.string()),
+    pa.field("name", pa.string()),
+    pa.field("released", pa.string()),
+    pa.field("tba", pa.bool_()),
+    pa.field("background_image", pa.string()),
+    pa.field("rating", pa.float64()),
+    pa.field("rating_top", pa.int64()),
+    pa.field("ratings", pa.string()),
+    pa.field("ratings_count", pa.int64()),
+    pa.field("reviews_text_count", pa.int64()),
+    pa.field("added", pa.int64()),
+    pa.field("added_by_status", pa.string()),
+    pa.field("metacritic", pa.float64()),
+    pa.field("playtime", pa.int64()),
+    pa.field("suggestions_count", pa.int64()),
+    pa.field("updated", pa.string()),
+    pa.field("user_game", pa.string()),
+    pa.field("reviews_count", pa.int64()),
+    pa.field("saturated_color", pa.string()),
+    pa.field("dominant_color", pa.string()),
+    pa.field("platforms", pa.string()),
+    pa.field("parent_platforms", pa.string()),
+    pa.field("genres", pa.string()),
+    pa.field("stores", pa.string()),
+    pa.field("clip", pa.string()),
+    pa.field("tags", pa.string()),
+    pa.field("esrb_rating", pa.string()),
+    pa.field("short_screenshots", pa.string()),
+    pa.field("extraction_ts", pa.timestamp("us")),
+    pa.field("extraction_date", pa.string()),
+])
+
+# Claves que se extraen de cada juego de la API (todo el esquema menos las columnas de auditoría).
+# Las claves ausentes en un juego quedan nulas y las no declaradas se descartan.
+KNOWN_GAMES_KEYS = [name for name in GAMES_ARROW_SCHEMA.names if name not in ("extraction_ts", "extraction_date")]
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        """Serializa a JSON string usando orjson (implementado en C/Rust)."""
+        return orjson.dumps(obj).decode()
+except ImportError:
+    # orjson es opcional: si no está instalado usamos la librería estándar
+    def _json_dumps(obj: Any) -> str:
+        """Serializa a JSON string usando json de la librería estándar."""
+        return json.dumps(obj)
+
+
+# --- Manejo Robusto de Esquema para Delta Lake ---
+# Convertimos estructuras anidadas (dicts/listas) a JSON strings y manejamos Nulos.
+# Esto evita errores de "Type Mismatch" o "Ambiguous Boolean".
+
+# Columnas anidadas según el esquema documentado de RAWG para /games (frozenset: lookup O(1)).
+# `clip` y `user_game` suelen llegar nulos, pero cuando vienen informados son objetos JSON.
+_COMPLEX_COLS = frozenset({
+    "platforms", "parent_platforms", "genres", "stores", "tags", "esrb_rating",
+    "short_screenshots", "ratings", "added_by_status", "clip", "user_game"
+})
+
+
+def safe_serialize(x):
+    """Serializa objetos a JSON string de forma segura, evitando errores de numpy/pandas."""
+    if x is None: return None
+    if isinstance(x, (list, dict)): return _json_dumps(x)
+    if hasattr(x, 'tolist'): return _json_dumps(x.tolist()) # Numpy arrays
+    if pd.isna(x): return None
+    return str(x)
+
+
+def _page_to_columns(results: List[Dict[str, Any]]) -> Dict[str, list]:
+    """
+    Convierte una página a columnas (structure-of-arrays) recorriendo solo las claves
+    conocidas, y serializa las columnas anidadas en la misma pasada.
+    """
+    columns = {key: [] for key in KNOWN_GAMES_KEYS}
+    for game in results:
+        for key in KNOWN_GAMES_KEYS:
+            value = game.get(key)
+            if key in _COMPLEX_COLS:
+                value = safe_serialize(value)
+            columns[key].append(value)
+    return columns
+
+
+def _run_async(coro):
+    """
+    Ejecuta una corrutina hasta completarla desde código síncrono.
+    Dentro de Jupyter ya hay un event loop corriendo (asyncio.run fallaría),
+    así que en ese caso la corrutina se ejecuta en un hilo aparte.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    return asyncio.run(coro)
+
+
+class _GamesBronzeWriter:
+    """
+    Escribe la tabla Bronze games por tandas a medida que llegan las páginas,
+    en vez de acumular todos los juegos en memoria. Es thread-safe: las páginas
+    llegan desde varios hilos y los commits Delta se serializan con un lock.
+
+    La crea (particionada) si no existe; la primera tanda reemplaza la partición de esta
+    extraction_date en un único commit y las siguientes se agregan (Idempotencia).
+    Si no llega ningún juego, la tabla no se toca.
+    """
+
+    def __init__(self, path: str, extraction_date: str, chunk_rows: int = GAMES_WRITE_CHUNK_ROWS):
+        self.path = path
+        self.extraction_date = extraction_date
+        self.chunk_rows = chunk_rows
+        self.rows_written = 0
+        self._buffer: List[pa.Table] = []
+        self._buffered_rows = 0
+        self._prepared = False
+        self._lock = threading.Lock()
+
+    def write(self, table: pa.Table):
+        """Agrega una página al buffer y escribe una tanda si se superó `chunk_rows`."""
+        with self._lock:
+            self._buffer.append(table)
+            self._buffered_rows += table.num_rows
+            if self._buffered_rows >= self.chunk_rows:
+                self._flush()
+
+    def close(self):
+        """Escribe lo que quede en el buffer."""
+        with self._lock:
+            self._flush()
+
+    def abort(self):
+        """
+        Descarta el buffer tras una carga fallida. Si ya se escribieron tandas, borra la
+        partición de esta extraction_date para no dejarla incompleta (se recarga re-ejecutando).
+        """
+        with self._lock:
+            self._buffer, self._buffered_rows = [], 0
+            if self.rows_written:
+                logger.warning(f"Eliminando la partición incompleta extraction_date='{self.extraction_date}'...")
+                DeltaTable(self.path).delete(f"extraction_date = '{self.extraction_date}'")
+                self.rows_written = 0
+
+    def _prepare(self):
+        try:
+            DeltaTable(self.path)
+        except TableNotFoundError:
+            # Primera ejecución: creamos la tabla ya particionada y con tamaño de archivo objetivo
+            DeltaTable.create(
+                self.path,
+                schema=GAMES_ARROW_SCHEMA,
+                partition_by=["extraction_date"],
+                configuration=GAMES_TABLE_CONFIGURATION
+            )
+            logger.info(f"Creada nueva tabla Delta en {self.path}.")
+        else:
+            logger.info(f"Reemplazando partición existente para extraction_date='{self.extraction_date}'...")
+        self._prepared = True
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        if not self._prepared:
+            self._prepare()
+
+        # La primera tanda reemplaza los datos previos de ESTA fecha de extracción en el mismo
+        # commit (overwrite con predicate): si la escritura falla, la partición anterior queda intacta.
+        first_chunk = not self.rows_written
+        write_deltalake(
+            self.path,
+            pa.concat_tables(self._buffer),
+            mode="overwrite" if first_chunk else "append",
+            predicate=f"extraction_date = '{self.extraction_date}'" if first_chunk else None,
+            partition_by=["extraction_date"],
+            writer_properties=BRONZE_WRITER_PROPERTIES
+        )
+        self.rows_written += self._buffered_rows
+        self._buffer, self._buffered_rows = [], 0
+
+
 class GameDataIngestor(RawgApiClient):
     """
     Ingesta datos desde la API de RAWG hacia la capa Bronze (Delta Lake).
@@ -31,7 +238,7 @@ class GameDataIngestor(RawgApiClient):
         logger.info(f"Iniciando Full Load para {endpoint}...")
         
         # Pagina 1 con 40 resultados suele ser suficiente para los géneros principales
-        response = self._get(endpoint, params={"page_size": 40})
+        response = self.get_resource(endpoint, params={"page_size": 40})
         
         if not response or "results" not in response:
             logger.error("No se pudieron obtener los géneros.")
@@ -42,15 +249,106 @@ class GameDataIngestor(RawgApiClient):
         # Serializamos columnas complejas (listas/dicts) a JSON string para consistencia
         for col in df.columns:
             if df[col].apply(lambda x: isinstance(x, (dict, list))).any():
-                df[col] = df[col].apply(json.dumps)
+                df[col] = df[col].apply(_json_dumps)
+        
+        table = pa.Table.from_pandas(df, preserve_index=False)
         
         save_path = os.path.join(self.bronze_path, "genres")
         try:
-            write_deltalake(save_path, df, mode="overwrite")
+            write_deltalake(save_path, table, mode="overwrite", writer_properties=BRONZE_WRITER_PROPERTIES)
             logger.info(f"Guardados {len(df)} géneros en {save_path} (Mode: overwrite).")
         except Exception as e:
             logger.error(f"Error escribiendo en Delta Lake: {e}")
 
+    async def _fetch_all_pages(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        max_pages: Optional[int],
+        process_page: Callable[[List[Dict[str, Any]]], int],
+    ) -> int:
+        """
+        Descarga concurrentemente todas las páginas de un endpoint paginado.
+        La página 1 se pide primero para estimar el total (`count`); el resto se lanza
+        en paralelo, acotado por el semáforo y el rate limiter del cliente.
+        Como `count` puede cambiar entre requests, el fin de datos lo marca `next`: una
+        página inexistente (404) o vacía se toma como fin, y si la última página estimada
+        todavía trae `next` se siguen pidiendo páginas.
+        Cada página se procesa con `process_page` en un hilo aparte apenas llega,
+        de modo que su conversión y escritura se solapan con la descarga de las siguientes.
+
+        Args:
+            endpoint (str): Endpoint de la API (ej. 'games').
+            params (dict): Parámetros de consulta (sin 'page'). Debe incluir 'page_size'.
+            max_pages (int, optional): Límite de páginas. Si es None, descarga TODO.
+            process_page (callable): Función que recibe los `results` de una página y devuelve cuántas filas procesó.
+
+        Returns:
+            int: Total de filas procesadas (0 si no hubo resultados).
+        """
+        loop = asyncio.get_running_loop()
+        parsing = []
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+
+            def submit(response: Dict[str, Any]):
+                parsing.append(loop.run_in_executor(executor, process_page, response["results"]))
+
+            async with AsyncRawgApiClient() as client:
+
+                async def fetch(page: int):
+                    # Devuelve (page, response); response es None si la página ya no existe.
+                    try:
+                        return page, await client.get_resource(endpoint, params={**params, "page": page})
+                    except RawgRequestError as e:
+                        # Un fallo reintentable que persiste aborta la carga en vez de dejar la partición incompleta
+                        if e.retried:
+                            raise RuntimeError(f"La página {page} falló tras agotar los reintentos ({e}). Se aborta la carga.") from e
+                        if e.status == 404 and page > 1:
+                            return page, None
+                        raise RuntimeError(f"La página {page} devolvió un error no reintentable ({e}). Se aborta la carga.") from e
+
+                _, first = await fetch(1)
+                if not first.get("results"):
+                    return 0
+                submit(first)
+
+                count = first.get("count", 0)
+                has_next = bool(first.get("next"))
+                fetched = 1
+                while has_next and not (max_pages and fetched >= max_pages):
+                    # Páginas según el total informado por la API; si `count` quedó corto, al menos una más
+                    last_page = max(fetched + 1, math.ceil(count / params["page_size"]))
+                    if max_pages:
+                        last_page = min(last_page, max_pages)
+                    logger.info(f"Páginas disponibles: {last_page}.")
+
+                    has_next = False
+                    tasks = [asyncio.ensure_future(fetch(page)) for page in range(fetched + 1, last_page + 1)]
+                    try:
+                        for next_done in asyncio.as_completed(tasks):
+                            page, response = await next_done
+                            if response is None or not response.get("results"):
+                                # `count` estaba desfasado: la página ya no tiene datos (fin de datos)
+                                logger.info(f"La página {page} no tiene resultados. Fin de datos.")
+                                continue
+                            submit(response)
+                            if page == last_page:
+                                has_next = bool(response.get("next"))
+                                count = response.get("count", count)
+                    except Exception:
+                        # Cancelamos las descargas pendientes antes de cerrar la sesión
+                        for task in tasks:
+                            task.cancel()
+                        await asyncio.gather(*tasks, return_exceptions=True)
+                        raise
+                    fetched = last_page
+
+                if has_next:
+                    logger.info(f"Se alcanzó el límite de páginas configurado ({max_pages}). Deteniendo.")
+
+            return sum(await asyncio.gather(*parsing))
+
     def get_games_incremental(self, start_date: str, end_date: str, max_pages: Optional[int] = None):
         """
         Descarga juegos incrementalmente filtrando por rango de fechas (released).
@@ -63,121 +361,61 @@ class GameDataIngestor(RawgApiClient):
         endpoint = "games"
         logger.info(f"Iniciando Carga Incremental para juegos ({start_date} a {end_date})...")
         
-        all_games = []
-        page = 1
-        dates_param = f"{start_date},{end_date}"
-        
-        # Bucle de Paginación
-        while True:
-            # Check de seguridad si se especifica límite
-            if max_pages and page > max_pages:
-                logger.info(f"Se alcanzó el límite de páginas configurado ({max_pages}). Deteniendo.")
-                break
-
-            total_status = f"/{max_pages}" if max_pages else ""
-            logger.info(f"Cargando página {page}{total_status}...")
-            
-            params = {
-                "dates": dates_param,
-                "page": page,
-                "page_size": 20,
-                "ordering": "-released"
-            }
-            
-            response = self._get(endpoint, params=params)
-            
-            if not response or "results" not in response:
-                break
-            
-            results = response["results"]
-            if not results:
-                break
-                
-            all_games.extend(results)
-            
-            if not response.get("next"):
-                logger.info("No hay más páginas disponibles.")
-                break
-            page += 1
-            
-        if not all_games:
-            logger.warning("No se encontraron juegos en el rango especificado.")
-            return
+        params = {
+            "dates": f"{start_date},{end_date}",
+            "page_size": 20,
+            "ordering": "-released"
+        }
 
-        # Preparación del DataFrame
-        df = pd.DataFrame(all_games)
-        
         # Columnas de Auditoría
         extraction_ts = datetime.now()
         extraction_date_str = extraction_ts.strftime("%Y-%m-%d")
-        
-        df["extraction_ts"] = extraction_ts
-        df["extraction_date"] = extraction_date_str
-        
-        # --- Manejo Robusto de Esquema para Delta Lake ---
-        # Convertimos estructuras anidadas (dicts/listas) a JSON strings y manejamos Nulos.
-        # Esto evita errores de "Type Mismatch" o "Ambiguous Boolean".
-        
-        complex_cols = ["platforms", "parent_platforms", "genres", "stores", "tags", "esrb_rating", "short_screenshots"]
-        
-        def safe_serialize(x):
-            """Serializa objetos a JSON string de forma segura, evitando errores de numpy/pandas."""
-            if x is None: return None
-            if isinstance(x, (list, dict)): return json.dumps(x)
-            if hasattr(x, 'tolist'): return json.dumps(x.tolist()) # Numpy arrays
-            if pd.isna(x): return None
-            return str(x)
 
-        for col in df.columns:
-            # 1. Si toda la columna es nula, forzamos tipo string
-            if df[col].isnull().all():
-                df[col] = df[col].astype(str)
-                continue
-
-            # 2. Si detectamos columnas complejas, aplicamos serialización
-            is_complex = col in complex_cols
-            if not is_complex:
-                try:
-                    # Heurística rápida para detectar objetos anidados
-                    if df[col].apply(lambda x: isinstance(x, (dict, list))).any():
-                        is_complex = True
-                except:
-                    pass
-            
-            if is_complex:
-                df[col] = df[col].apply(safe_serialize)
-                df[col] = df[col].astype(str).replace('None', None)
-
-        # --- Escritura Idempotente ---
+        # --- Escritura Idempotente por tandas ---
         save_path = os.path.join(self.bronze_path, "games")
-        
+        writer = _GamesBronzeWriter(save_path, extraction_date_str)
+
+        def write_page(results: List[Dict[str, Any]]) -> int:
+            """Convierte una página a Arrow y la entrega al writer (se ejecuta mientras se descargan las demás)."""
+            columns = _page_to_columns(results)
+            # Valores constantes construidos directamente en Arrow.
+            # (No se usa dictionary-encoding: delta-rs no admite columnas de partición de tipo diccionario.)
+            for name, value in (("extraction_ts", extraction_ts), ("extraction_date", extraction_date_str)):
+                field = GAMES_ARROW_SCHEMA.field(name)
+                columns[name] = pa.repeat(pa.scalar(value, type=field.type), len(results))
+            table = pa.Table.from_pydict(columns, schema=GAMES_ARROW_SCHEMA)
+            writer.write(table)
+            return table.num_rows
+
         try:
-            # Paso A: Intentamos conectar a la tabla Delta existente
-            if os.path.exists(save_path):
-                dt = DeltaTable(save_path)
-                # Paso B: Borramos datos previos de ESTA fecha de extracción (Idempotencia)
-                logger.info(f"Limpiando partición existente para extraction_date='{extraction_date_str}'...")
-                dt.delete(f"extraction_date = '{extraction_date_str}'")
-            
-            # Paso C: Escribimos los nuevos datos (Append)
-            write_deltalake(
-                save_path, 
-                df, 
-                mode="append", 
-                partition_by=["extraction_date"],
-                schema_mode="merge"
-            )
-            logger.info(f"Guardados {len(df)} juegos exitosamente (Mode: Idempotent Append).")
-            
+            total_rows = _run_async(self._fetch_all_pages(endpoint, params, max_pages, process_page=write_page))
+            writer.close()
         except Exception as e:
-            # Si la tabla no existe (primera ejecución), simplemente escribimos
-            if "No file" in str(e) or "Not a Delta table" in str(e) or not os.path.exists(save_path):
-                write_deltalake(
-                    save_path, 
-                    df, 
-                    mode="append", 
-                    partition_by=["extraction_date"]
-                )
-                logger.info(f"Creada nueva tabla Delta con {len(df)} juegos.")
-            else:
-                logger.error(f"Fallo crítico escribiendo en Delta Lake: {e}")
+            logger.error(f"Fallo crítico en la carga incremental de juegos: {e}")
+            writer.abort()
+            raise
+
+        if not total_rows:
+            logger.warning("No se encontraron juegos en el rango especificado.")
+            return
+
+        logger.info(f"Guardados {writer.rows_written} juegos exitosamente (Mode: Idempotent Append).")
+
+    def run_all(self, start_date: str, end_date: str, max_pages: Optional[int] = None):
+        """
+        Ejecuta en paralelo la carga completa de géneros y la incremental de juegos.
+        Son independientes y pasan casi todo el tiempo esperando red y disco (la escritura
+        Delta en Rust libera el GIL), por lo que el tiempo total ≈ el de la más lenta.
+
+        Args:
+            start_date (str): Fecha de inicio (YYYY-MM-DD) para los juegos.
+            end_date (str): Fecha de fin (YYYY-MM-DD) para los juegos.
+            max_pages (int, optional): Límite de páginas de juegos. Si es None, descarga TODO.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.get_genres_full),
+                executor.submit(self.get_games_incremental, start_date, end_date, max_pages),
+            ]
+            # Propagamos cualquier error no manejado de las cargas
+            [future.result() for future in futures]
@@ -1,12 +1,25 @@
 import os
-import json
 import logging
+import duckdb
 import pandas as pd
+import pyarrow as pa
 from deltalake import DeltaTable, write_deltalake
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    # orjson is optional: fall back to the standard library parser
+    from json import loads as _json_loads
+
+# Bronze games columns actually used downstream (projection pushed down to the Delta scan)
+BRONZE_GAMES_COLUMNS = [
+    'id', 'slug', 'name', 'released', 'tba', 'background_image', 'rating',
+    'rating_top', 'metacritic', 'genres', 'extraction_date'
+]
+
 class GameTransformer:
     """
     Transforms data from Bronze to Silver layer.
@@ -27,7 +40,9 @@ class GameTransformer:
         games_path = os.path.join(self.bronze_path, "games")
         try:
             dt = DeltaTable(games_path)
-            df = dt.to_pandas()
+            # Read only the needed columns; every extraction_date is kept for the daily history
+            table_cols = {field.name for field in dt.schema().fields}
+            df = dt.to_pandas(columns=[c for c in BRONZE_GAMES_COLUMNS if c in table_cols])
             logger.info(f"Loaded {len(df)} records from Bronze Games.")
         except Exception as e:
             logger.error(f"Failed to load Bronze data from {games_path}: {e}")
@@ -38,14 +53,13 @@ class GameTransformer:
             return
 
         # 2. DATA CLEANING & TYPING
-        # Convert 'released' to datetime
-        df['released'] = pd.to_datetime(df['released'], errors='coerce')
+        # Convert 'released' to datetime (RAWG sends ISO dates; explicit format skips inference)
+        df['released'] = pd.to_datetime(df['released'], format="%Y-%m-%d", errors='coerce', cache=True)
         
         # Deduplication: Keep one record per game PER DAY (Daily History)
         # This allows tracking evolution (e.g. rating changes) over time.
-        # We sort by extraction_date to ensure deterministic results.
-        df.sort_values(by='extraction_date', ascending=True, inplace=True)
-        df.drop_duplicates(subset=['id', 'extraction_date'], keep='last', inplace=True)
+        # The key already includes extraction_date, so no global sort is needed to tie-break.
+        df = df.drop_duplicates(subset=['id', 'extraction_date'], keep='first', ignore_index=True)
 
         # 3. COMPLEX TRANSFORMATION (Logic)
         # Metacritic: Impute or Create logic
@@ -60,19 +74,20 @@ class GameTransformer:
             if not genre_json_str:
                 return []
             try:
-                genres = json.loads(genre_json_str)
+                genres = _json_loads(genre_json_str)
                 if isinstance(genres, list):
-                    return [g.get('name') for g in genres]
-            except:
+                    return [g.get('name') for g in genres if isinstance(g, dict)]
+            except (TypeError, ValueError):
                 pass
             return []
 
-        df['genre_list'] = df['genres'].apply(extract_genre_names)
+        # Iterate the raw ndarray instead of Series.apply (no per-element pandas boxing)
+        df['genre_list'] = [extract_genre_names(s) for s in df['genres'].to_numpy()]
         # Create a primary genre for simple analysis
         df['primary_genre'] = df['genre_list'].apply(lambda x: x[0] if x else "Unknown")
         
-        # Extract Year
-        df['released_year'] = df['released'].dt.year
+        # Extract Year (nullable Int16 instead of float64)
+        df['released_year'] = df['released'].dt.year.astype('Int16')
         
         # 5. SAVE SILVER (Refined)
         # Select useful columns
@@ -87,34 +102,34 @@ class GameTransformer:
         
         refined_path = os.path.join(self.silver_path, "games_refined")
         try:
-            write_deltalake(refined_path, df_refined, mode="overwrite")
+            write_deltalake(refined_path, df_refined, mode="overwrite", schema_mode="overwrite")
             logger.info(f"Saved {len(df_refined)} records to {refined_path}")
         except Exception as e:
             logger.error(f"Failed to write refined data: {e}")
 
         # 6. AGGREGATION & ANALYTICS
-        # Explode genres to count games per genre properly
-        df_exploded = df.explode('genre_list')
-        df_exploded.rename(columns={'genre_list': 'genre'}, inplace=True)
-        
-        # Group by Year and Genre
-        # Filter out invalid years or genres
-        df_analytics = df_exploded.dropna(subset=['released_year', 'genre'])
-        
-        analytics_df = df_analytics.groupby(['released_year', 'genre']).agg(
-            avg_rating=('rating', 'mean'),
-            game_count=('id', 'count')
-        ).reset_index()
-        
-        # Sort for better readability
-        analytics_df.sort_values(by=['released_year', 'game_count'], ascending=[False, False], inplace=True)
-        
-        # Reset index completely to avoid __index_level_0__ artifact in Delta Lake
-        analytics_df.reset_index(drop=True, inplace=True)
+        # Unnest genres and aggregate by Year and Genre in DuckDB (vectorized, multi-threaded),
+        # without materializing an exploded pandas frame.
+        # Filter out invalid years or genres; genre ties are ordered by name for deterministic output.
+        games = pa.Table.from_pandas(
+            df[['id', 'rating', 'released_year', 'genre_list']], preserve_index=False
+        )
+        con = duckdb.connect()
+        try:
+            con.register('games', games)
+            analytics_df = con.execute("""
+                SELECT released_year, genre, AVG(rating) AS avg_rating, COUNT(id) AS game_count
+                FROM (SELECT id, rating, released_year, UNNEST(genre_list) AS genre FROM games)
+                WHERE released_year IS NOT NULL AND genre IS NOT NULL
+                GROUP BY released_year, genre
+                ORDER BY released_year DESC, game_count DESC, genre
+            """).df()
+        finally:
+            con.close()
         
         analytics_path = os.path.join(self.silver_path, "games_analytics")
         try:
-            write_deltalake(analytics_path, analytics_df, mode="overwrite")
+            write_deltalake(analytics_path, analytics_df, mode="overwrite", schema_mode="overwrite")
             logger.info(f"Saved {len(analytics_df)} analytics records to {analytics_path}")
         except Exception as e:
             logger.error(f"Failed to write analytics data: {e}")
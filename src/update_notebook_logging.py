@@ -1,6 +1,56 @@
+import io
 import json
 import os
 import logging
+import tokenize
+
+IPYTHON_PREFIXES = ('%', '!')
+
+def mask_ipython_lines(source: str) -> str:
+    """
+    Replaces IPython-only lines (%magics, !shell commands) with an equally indented 'pass',
+    keeping line numbers, so the cell can be tokenized and compiled as plain Python.
+    """
+    lines = source.splitlines(keepends=True)
+    for i, line in enumerate(lines):
+        stripped = line.lstrip()
+        if stripped.startswith(IPYTHON_PREFIXES):
+            lines[i] = line[:len(line) - len(stripped)] + 'pass\n'
+    return ''.join(lines)
+
+def find_basic_config_lines(source: str):
+    """
+    Returns the (first, last) 1-based line numbers spanned by the logging.basicConfig(...)
+    call in source, following the parentheses up to the matching ')', or None if absent.
+    """
+    window = []
+    start_row = None
+    depth = 0
+    try:
+        for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+            if start_row is None:
+                window = (window + [tok.string])[-4:]
+                if window == ['logging', '.', 'basicConfig', '(']:
+                    start_row, depth = tok.start[0], 1
+            elif tok.type == tokenize.OP and tok.string in '([{':
+                depth += 1
+            elif tok.type == tokenize.OP and tok.string in ')]}':
+                depth -= 1
+                if depth == 0:
+                    return start_row, tok.end[0]
+    except (tokenize.TokenError, SyntaxError):
+        pass
+    return None
+
+def compiles(source: str) -> bool:
+    """
+    Checks that a cell source is still valid Python after patching (IPython lines are masked).
+    """
+    try:
+        compile(mask_ipython_lines(source), '<cell>', 'exec')
+        return True
+    except SyntaxError:
+        return False
 
 def update_notebook_logging(notebook_path: str = None):
     """
@@ -46,33 +96,34 @@ def update_notebook_logging(notebook_path: str = None):
         "logging.info(f\"Logging iniciado. Archivo: {log_file}\")\n"
     ]
 
-    # Find the cell and replace the line
+    # Find the cell and replace the whole basicConfig call (tokenized over each cell's joined source)
     found = False
     for cell in nb['cells']:
-        if cell['cell_type'] == 'code':
-            source = cell['source']
-            for i, line in enumerate(source):
-                # Check for old config OR new config (to avoid re-patching if already correct but just update the code block)
-                if "logging.basicConfig" in line:
-                    # Logic to determine if update is needed could be here, but simpler to just overwrite 
-                    # if it looks like a logging config block.
-                    # Warning: simple string matching. 
-                    cell['source'][i:i+len(new_logging_code)] = new_logging_code
-                    # Truncate if we replaced a single line with multiple previously, 
-                    # but here we might be replacing a block.
-                    # Best approach: Replace the WHOLE cell content if it's the specific config cell.
-                    # But finding specific cell is hard. 
-                    # Let's stick to the previous robust logic:
-                    # If line has basicConfig AND NOT FileHandler -> Update
-                    if "logging.FileHandler" not in ''.join(source):
-                         cell['source'][i:i+1] = new_logging_code
-                         found = True
-                    else:
-                        print("Notebook already has FileHandler configuration.")
-                        found = True # Considered "success" as it's already done
-                    break
-        if found:
-            break
+        if cell['cell_type'] != 'code':
+            continue
+        source = ''.join(cell['source'])
+        span = find_basic_config_lines(mask_ipython_lines(source))
+        if span is None:
+            continue
+
+        found = True  # Considered "success" also if it's already done
+        # If cell has basicConfig AND NOT FileHandler -> Update
+        if "logging.FileHandler" in source:
+            print("Notebook already has FileHandler configuration.")
+        else:
+            # Replace every line of the call, from 'logging.basicConfig(' to its closing ')',
+            # indenting the new block like the call (e.g. inside a def)
+            lines = source.splitlines(keepends=True)
+            first, last = span
+            indent = lines[first - 1][:len(lines[first - 1]) - len(lines[first - 1].lstrip())]
+            new_code = [indent + line if line.strip() else line for line in new_logging_code]
+            patched = ''.join(lines[:first - 1] + new_code + lines[last:])
+            # Only a cell the patch itself breaks is rejected (one that was already invalid is patched as before)
+            if compiles(source) and not compiles(patched):
+                print("Error: patched logging cell does not compile; notebook left unchanged.")
+                return
+            cell['source'] = patched.splitlines(keepends=True)
+        break
 
     if found:
         with open(notebook_path, 'w', encoding='utf-8') as f: